@@ -60,7 +60,7 @@ def main():
     # Step 4: Save to file
     output_path = Path("example_output.lsc")
     print(f"\n💾 Saving to {output_path}...")
-    compressor.save(output_path)
+    compressor.save(output_path, verbose=True)
     print(f"   Saved! File size: {output_path.stat().st_size} bytes")
     
     # Step 5: Demonstrate loading
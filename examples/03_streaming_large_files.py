@@ -78,7 +78,7 @@ def stream_compress_file(input_path: str, output_path: str, batch_size: int = 10
     
     # Save compressed file
     print("💾 Saving compressed file...")
-    compressor.save(Path(output_path))
+    compressor.save(Path(output_path), verbose=True)
     
     # Calculate results
     total_time = time.time() - start_time
@@ -11,14 +11,31 @@ Use cases:
 - Production log pipeline
 
 This example shows how to:
-1. Monitor a directory for new/rotated log files
-2. Automatically compress them when created
+1. Monitor directories for new/rotated log files (one shared inotify
+   instance on Linux, watchdog elsewhere)
+2. Automatically compress them once they are complete
 3. Optionally delete originals after compression
 4. Track compression statistics
 5. Handle errors gracefully
 
+Events:
+    With inotify, only two events start a compression, so files that are
+    still being written are never touched and no per-write events are
+    delivered:
+    - close-after-write (IN_CLOSE_WRITE): copytruncate copies, or any
+      writer that finished a file in place
+    - rename into the watched name (IN_MOVED_TO): logrotate's default
+      "rename, then create a fresh log" rotation
+    The freshly created empty log is skipped by --min-size.
+    
+    Other watchdog backends (macOS, Windows) report no close events, so
+    there created and modified files are acted on as well, once they have
+    been quiet for --debounce seconds.
+
 Requirements:
-    pip install watchdog
+    pip install pybloom-live
+    pip install inotify_simple   # Linux
+    pip install watchdog         # other platforms
 
 Run:
     python 09_log_rotation_handler.py /path/to/logs /path/to/compressed
@@ -39,32 +56,279 @@ Integration with logrotate:
 """
 
 import os
+import re
 import sys
 import time
 import argparse
+import json
+import tempfile
+import logging
+import logging.handlers
+import multiprocessing
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Optional
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileCreatedEvent
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+from pybloom_live import ScalableBloomFilter
 from logpress import LogPress
 
+# Per-file progress goes through this logger; see _setup_logging()
+logger = logging.getLogger('logpress.rotate')
+
+try:
+    from inotify_simple import INotify, flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+# Regular (.log) and rotated (.log.1, .log.2, ...) log file names
+_LOG_RE = re.compile(r'\.log(?:\.\d+)?$')
+
+
+def _is_log_name(name: str) -> bool:
+    """Cheap name check applied before any event reaches the handler"""
+    # Plain .log needs no regex
+    return name.endswith('.log') or _LOG_RE.search(name) is not None
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    """Snapshot of one stat() call, passed through the whole pipeline"""
+    path: Path
+    size: int
+    mtime_ns: int
+    
+    @classmethod
+    def from_path(cls, file_path: str) -> Optional['FileInfo']:
+        """
+        Stat a file once
+        
+        Args:
+            file_path: Path to the file
+        
+        Returns:
+            FileInfo, or None if the file vanished or is unreadable
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return cls(Path(file_path), st.st_size, st.st_mtime_ns)
+    
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry) -> Optional['FileInfo']:
+        """
+        Build from a scandir entry (its stat() result is cached on the entry)
+        
+        Args:
+            entry: Directory entry from os.scandir
+        
+        Returns:
+            FileInfo, or None if the file vanished or is unreadable
+        """
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            return None
+        return cls(Path(entry.path), st.st_size, st.st_mtime_ns)
 
-class LogCompressionHandler(FileSystemEventHandler):
+
+# Process umask, read once at import (before any threads start), so staged
+# archives get the same permissions as a plainly created file
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _output_name(path: Path, mtime_ns: int, delete_original: bool) -> str:
+    """
+    Name of the .lsc archive for one version of a log file
+    
+    A live log (app.log) that is kept keeps growing, so it has a single
+    archive that each newer version replaces. Rotated logs (app.log.1,
+    app.log.2) hold a different file after every rotation cycle, and so
+    does any path whose original is deleted after compression: those
+    archives are keyed by the source mtime (UTC, nanoseconds, the same
+    value the journal records) so no archive of an earlier file is
+    overwritten.
+    
+    Args:
+        path: Path to the log file
+        mtime_ns: Modification time of the version being compressed
+        delete_original: Whether originals are deleted after compression
+    
+    Returns:
+        File name such as 'app.log.lsc' or
+        'app.log.1.20240101T031500.000000000Z.lsc'
+    """
+    if path.name.endswith('.log') and not delete_original:
+        return f"{path.name}.lsc"
+    seconds, nanos = divmod(mtime_ns, 1_000_000_000)
+    stamp = datetime.fromtimestamp(seconds, timezone.utc).strftime('%Y%m%dT%H%M%S')
+    return f"{path.name}.{stamp}.{nanos:09d}Z.lsc"
+
+
+# One LogPress per process and min_support, reused across files so the
+# tokenizer and semantic-type patterns are only compiled once per worker
+_logpress_instances: Dict[int, LogPress] = {}
+
+
+def _get_logpress(min_support: int) -> LogPress:
+    """Return this process's LogPress instance for a min_support value"""
+    lp = _logpress_instances.get(min_support)
+    if lp is None:
+        lp = _logpress_instances[min_support] = LogPress(min_support=min_support)
+    return lp
+
+
+def _compress_one(
+    file_path: str,
+    output_dir: str,
+    min_support: int = 3,
+    delete_original: bool = False
+) -> Dict[str, Any]:
+    """
+    Compress a single log file and report the outcome as a plain dict
+    
+    Module-level so it can run in a worker process: the handler is never
+    pickled, and each process reuses its own LogPress instance. Output is
+    written to a .tmp staging file and renamed into place, so a crash never
+    leaves a truncated .lsc behind; each task stages in its own uniquely
+    named file, so concurrent workers never share one.
+    
+    Args:
+        file_path: Path to the log file
+        output_dir: Directory to store compressed files
+        min_support: Minimum logs per template
+        delete_original: Whether to delete original after compression
+    
+    Returns:
+        Result dictionary with 'path', 'ok', 'elapsed' and either the
+        compression statistics (plus 'source_mtime_ns' and 'started_at') or
+        an 'error' message
+    """
+    path = Path(file_path)
+    start_time = time.time()
+    
+    try:
+        # mtime of the version being compressed; later writes change it
+        source_mtime_ns = os.stat(file_path).st_mtime_ns
+        output_path = Path(output_dir) / _output_name(path, source_mtime_ns, delete_original)
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix=f".{path.name}.", suffix='.lsc.tmp')
+        os.close(fd)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)  # mkstemp creates it 0600
+        try:
+            stats = _get_logpress(min_support).compress_file(str(path), str(tmp_path))
+            # The archive carries its source's mtime (like gzip), so a log
+            # written to during compression is still newer than its archive
+            os.utime(tmp_path, ns=(time.time_ns(), source_mtime_ns))
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        
+        deleted = False
+        if delete_original:
+            os.remove(file_path)
+            deleted = True
+        
+        return {
+            'path': str(path),
+            'ok': True,
+            'original_size': stats['original_size'],
+            'compressed_size': stats['compressed_size'],
+            'compression_ratio': stats['compression_ratio'],
+            'space_saved_mb': stats.get('space_saved_mb', 0),
+            'deleted': deleted,
+            'source_mtime_ns': source_mtime_ns,
+            'started_at': start_time,
+            'elapsed': time.time() - start_time,
+        }
+    except Exception as e:
+        return {
+            'path': str(path),
+            'ok': False,
+            'error': str(e),
+            'elapsed': time.time() - start_time,
+        }
+
+
+def _ignore_sigint():
+    """Pool initializer: Ctrl+C is handled by the main process, which drains the pool"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _make_pool(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """
+    Process pool for compressions
+    
+    Workers share the terminal's process group, so they ignore SIGINT:
+    otherwise Ctrl+C kills in-flight compressions and every idle worker
+    prints a KeyboardInterrupt traceback. They are started by a forkserver
+    (where available) rather than forked from a parent whose watcher and
+    debounce threads are running.
+    
+    Args:
+        max_workers: Worker processes (default: CPU count)
+    """
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_ignore_sigint
+    )
+
+
+def _result_of(future: Future, file_path: str) -> Dict[str, Any]:
+    """
+    Result of a pooled _compress_one call, or a failure result if its
+    worker process died (e.g. OOM-killed) before returning one
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return {'path': file_path, 'ok': False, 'error': str(e), 'elapsed': 0.0}
+
+
+class LogCompressionHandler:
     """
     File system event handler for automatic log compression
     
-    Monitors a directory and compresses log files when:
-    - New .log files are created (rotation)
-    - Files with .log.1, .log.2, etc. extensions appear
+    Receives file paths from the directory watcher and compresses log files when:
+    - New .log files are fully written (closed by their writer)
+    - Files with .log.1, .log.2, etc. extensions are moved in (rotation)
+    
+    Events are coalesced per path: a file is only considered once it has
+    been quiet for debounce_sec, so a writer that keeps reopening and
+    closing it costs one processing decision instead of one per write.
+    The compression itself runs in a process pool so the watcher keeps
+    draining events while large files are being compressed.
     """
     
+    # How often the debounce thread looks for quiet paths (seconds)
+    DEBOUNCE_POLL_INTERVAL = 0.25
+    
+    # Journal of compressed files kept in the output directory
+    JOURNAL_NAME = '.processed.jsonl'
+    JOURNAL_COMPACT_LINES = 10_000
+    
+    # False-positive rate of the in-memory processed-files filter
+    PROCESSED_ERROR_RATE = 0.001
+    
     def __init__(
         self,
         output_dir: str,
         min_support: int = 3,
         delete_original: bool = False,
-        min_size_kb: int = 10
+        min_size_kb: int = 10,
+        debounce_sec: float = 2.0,
+        max_workers: Optional[int] = None
     ):
         """
         Initialize the compression handler
@@ -74,12 +338,13 @@ class LogCompressionHandler(FileSystemEventHandler):
             min_support: Minimum logs per template
             delete_original: Whether to delete original after compression
             min_size_kb: Minimum file size to compress (KB)
+            debounce_sec: Quiet period before an event is acted on (seconds)
+            max_workers: Worker processes for submit() (default: CPU count)
         """
-        super().__init__()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        self.lp = LogPress(min_support=min_support)
+        self.lp = _get_logpress(min_support)
         self.delete_original = delete_original
         self.min_size_bytes = min_size_kb * 1024
         
@@ -92,131 +357,281 @@ class LogCompressionHandler(FileSystemEventHandler):
             'total_time': 0.0
         }
         
-        # Track processed files to avoid duplicates
-        self.processed_files = set()
+        # Track processed and in-flight files to avoid duplicates. Processed
+        # (path, mtime) versions live in a scalable bloom filter, so memory
+        # stays around 2 bytes per file however long the watcher runs; the
+        # on-disk journal is the source of truth for its "maybe" answers.
+        # The filter, the in-flight set and the statistics are shared with the
+        # pool's callbacks.
+        self.journal_path = self.output_dir / self.JOURNAL_NAME
+        self.processed_files = ScalableBloomFilter(
+            mode=ScalableBloomFilter.SMALL_SET_GROWTH,
+            error_rate=self.PROCESSED_ERROR_RATE
+        )
+        self._load_journal()
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        
+        # Workers are only spawned on the first submit()
+        self.max_workers = max_workers
+        self.pool = _make_pool(max_workers)
+        
+        # Debounce state: path -> monotonic time of its latest event
+        self.debounce_sec = debounce_sec
+        self._pending: Dict[str, float] = {}
+        self._pending_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._debounce_thread: Optional[threading.Thread] = None
     
-    def should_process(self, file_path: str) -> bool:
+    def should_process(self, info: FileInfo) -> bool:
         """
         Determine if a file should be compressed
         
         Args:
-            file_path: Path to the file
+            info: Stat snapshot of the file
         
         Returns:
             True if file should be processed
         """
-        path = Path(file_path)
+        path = info.path
         
-        # Check if already processed
-        if str(path) in self.processed_files:
-            return False
-        
-        # Check file extension patterns
-        valid_extensions = [
-            '.log',           # Regular log files
-            '.log.1',         # Rotated logs
-            '.log.2',
-            '.log.3',
-        ]
+        # Check if currently being compressed
+        with self._lock:
+            if str(path) in self._in_flight:
+                return False
         
-        # Check if file matches any valid pattern
-        is_log_file = any(str(path).endswith(ext) for ext in valid_extensions)
-        if not is_log_file:
+        # Check file name pattern
+        if not _is_log_name(path.name):
             return False
         
         # Check file size
+        if info.size < self.min_size_bytes:
+            logger.info(f"⊘ Skipping {path.name} (too small)")
+            return False
+        
+        # Archives take their source's mtime, so one at least as new as the
+        # file means this version was compressed; logs that grew since are
+        # compressed again (replacing the archive of a live log)
+        output_path = self.output_dir / _output_name(path, info.mtime_ns, self.delete_original)
         try:
-            if os.path.getsize(file_path) < self.min_size_bytes:
-                print(f"⊘ Skipping {path.name} (too small)")
-                return False
-        except OSError:
+            output_mtime_ns = output_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            output_mtime_ns = None
+        if output_mtime_ns is not None and output_mtime_ns >= info.mtime_ns:
+            logger.info(f"⊘ Skipping {path.name} (already compressed)")
             return False
         
-        # Check if output already exists
-        output_name = f"{path.stem}.lsc"
-        output_path = self.output_dir / output_name
-        if output_path.exists():
-            print(f"⊘ Skipping {path.name} (already compressed)")
+        # Output gone (e.g. removed by retention): if this exact version was
+        # compressed before, don't compress it again. The filter rules out
+        # most files in memory; a hit is confirmed on disk.
+        key = self._processed_key(str(path), info.mtime_ns)
+        with self._lock:
+            maybe_processed = key in self.processed_files
+        if maybe_processed and self._journal_contains(str(path), info.mtime_ns):
+            logger.info(f"⊘ Skipping {path.name} (already compressed, output removed)")
             return False
         
         return True
     
-    def compress_file(self, file_path: str):
+    def compress_file(self, info: FileInfo):
         """
         Compress a single log file
         
         Args:
-            file_path: Path to the log file
+            info: Stat snapshot of the log file
+        """
+        logger.debug(f"🔄 Compressing {info.path.name}")
+        result = _compress_one(
+            str(info.path),
+            str(self.output_dir),
+            min_support=self.lp.min_support,
+            delete_original=self.delete_original
+        )
+        self.record_result(result)
+    
+    def submit(self, info: FileInfo) -> Future:
         """
-        path = Path(file_path)
+        Compress a log file in the process pool without blocking the caller
         
+        Args:
+            info: Stat snapshot of the log file
+        
+        Returns:
+            Future resolving to the _compress_one result dictionary
+        """
+        file_path = str(info.path)
+        with self._lock:
+            self._in_flight.add(file_path)
+        
+        logger.debug(f"🔄 Queued {info.path.name}")
+        args = (_compress_one, file_path, str(self.output_dir), self.lp.min_support, self.delete_original)
         try:
-            # Wait a moment to ensure file is fully written
-            time.sleep(0.5)
-            
-            # Determine output path
-            output_name = f"{path.stem}.lsc"
-            output_path = self.output_dir / output_name
-            
-            print(f"🔄 Compressing {path.name}...", end=" ", flush=True)
-            start_time = time.time()
-            
-            # Compress the file
-            stats = self.lp.compress_file(str(path), str(output_path))
-            
-            elapsed = time.time() - start_time
-            
+            try:
+                future = self.pool.submit(*args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed) and took the pool with it;
+                # start a fresh one so watch mode keeps compressing
+                logger.error("✗ Worker process died, restarting the pool")
+                self._replace_pool()
+                future = self.pool.submit(*args)
+        except BaseException:
+            with self._lock:
+                self._in_flight.discard(file_path)
+            raise
+        future.add_done_callback(lambda f: self._on_done(file_path, f))
+        return future
+    
+    def _replace_pool(self):
+        """Swap a broken process pool for a new one"""
+        broken, self.pool = self.pool, _make_pool(self.max_workers)
+        broken.shutdown(wait=False)
+    
+    def _on_done(self, file_path: str, future: Future):
+        """Completion callback: record the result of a pooled compression"""
+        result = _result_of(future, file_path)
+        
+        with self._lock:
+            self._in_flight.discard(file_path)
+        self.record_result(result)
+    
+    def record_result(self, result: Dict[str, Any]):
+        """
+        Fold the result of a compression into the running statistics
+        
+        Args:
+            result: Dictionary returned by _compress_one
+        """
+        name = Path(result['path']).name
+        
+        if not result['ok']:
+            with self._lock:
+                self.stats['files_failed'] += 1
+            logger.error(f"✗ FAILED {name}: {result['error']}")
+            return
+        
+        with self._lock:
             # Update statistics
             self.stats['files_processed'] += 1
-            self.stats['total_original_size'] += stats['original_size']
-            self.stats['total_compressed_size'] += stats['compressed_size']
-            self.stats['total_time'] += elapsed
+            self.stats['total_original_size'] += result['original_size']
+            self.stats['total_compressed_size'] += result['compressed_size']
+            self.stats['total_time'] += result['elapsed']
             
             # Mark as processed
-            self.processed_files.add(str(path))
-            
-            # Print success
-            ratio = stats['compression_ratio']
-            saved_mb = stats.get('space_saved_mb', 0)
-            print(f"✓ {ratio:.1f}× ratio, saved {saved_mb:.1f} MB ({elapsed:.2f}s)")
-            
-            # Delete original if requested
-            if self.delete_original:
-                os.remove(file_path)
-                print(f"  🗑️  Deleted original: {path.name}")
-            
-        except Exception as e:
-            self.stats['files_failed'] += 1
-            print(f"✗ FAILED: {str(e)}")
+            self.processed_files.add(self._processed_key(result['path'], result['source_mtime_ns']))
+            self._append_journal(result['path'], result['source_mtime_ns'], result['started_at'])
+        
+        # Report success
+        logger.info(f"✓ {name}: {result['compression_ratio']:.1f}× ratio, "
+                    f"saved {result['space_saved_mb']:.1f} MB ({result['elapsed']:.2f}s)")
+        
+        if result['deleted']:
+            logger.info(f"  🗑️  Deleted original: {name}")
+    
+    @staticmethod
+    def _processed_key(path: str, mtime_ns: int) -> str:
+        """Filter key for one version of a file"""
+        return f"{path}\0{mtime_ns}"
+    
+    @staticmethod
+    def _read_journal(f):
+        """Yield (path, mtime_ns, ts) from journal lines, skipping damaged ones"""
+        for line in f:
+            try:
+                entry = json.loads(line)
+                yield entry['path'], entry['mtime_ns'], entry['ts']
+            except (ValueError, KeyError, TypeError):
+                # Torn write from a crash: ignore the line
+                continue
+    
+    def _load_journal(self):
+        """Fill the processed-files filter from the journal, compacting it when it grows large"""
+        line_count = 0
+        latest: Dict[str, Tuple[int, float]] = {}
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for path, mtime_ns, ts in self._read_journal(f):
+                    line_count += 1
+                    self.processed_files.add(self._processed_key(path, mtime_ns))
+                    latest[path] = (mtime_ns, ts)
+        except FileNotFoundError:
+            return
+        
+        # Keep only the newest version per path; the temporary map is
+        # released as soon as the journal has been rewritten
+        if line_count > self.JOURNAL_COMPACT_LINES:
+            tmp_path = self.journal_path.with_name(self.JOURNAL_NAME + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for path, (mtime_ns, ts) in latest.items():
+                    f.write(json.dumps({'path': path, 'mtime_ns': mtime_ns, 'ts': ts}) + '\n')
+            os.replace(tmp_path, self.journal_path)
+    
+    def _journal_contains(self, path: str, mtime_ns: int) -> bool:
+        """Confirm a filter hit by scanning the journal on disk"""
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                return any(p == path and m == mtime_ns for p, m, _ in self._read_journal(f))
+        except FileNotFoundError:
+            return False
+    
+    def _append_journal(self, path: str, mtime_ns: int, ts: float):
+        """Append one processed file version to the journal (caller holds the lock)"""
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'path': path, 'mtime_ns': mtime_ns, 'ts': ts}) + '\n')
     
-    def on_created(self, event: FileCreatedEvent):
+    def on_file_event(self, file_path: str):
         """
-        Called when a new file is created
+        Called by the directory watcher for every file event
+        
+        Only records the event; the debounce thread acts on it once the
+        path has been quiet for debounce_sec.
         
         Args:
-            event: File system event
+            file_path: Path of the file that was moved in or written
         """
-        if event.is_directory:
-            return
-        
-        if self.should_process(event.src_path):
-            self.compress_file(event.src_path)
+        with self._pending_lock:
+            self._pending[file_path] = time.monotonic()
+            if self._debounce_thread is None:
+                self._debounce_thread = threading.Thread(
+                    target=self._drain_pending, name="debounce", daemon=True
+                )
+                self._debounce_thread.start()
     
-    def on_modified(self, event):
+    def _drain_pending(self):
+        """Compress paths whose last event is older than debounce_sec"""
+        while not self._stop.wait(self.DEBOUNCE_POLL_INTERVAL):
+            cutoff = time.monotonic() - self.debounce_sec
+            with self._pending_lock:
+                ready = [p for p, last_seen in self._pending.items() if last_seen <= cutoff]
+                for p in ready:
+                    del self._pending[p]
+            
+            for file_path in ready:
+                # One bad path must not end the thread, or every later event
+                # would sit in _pending forever
+                try:
+                    info = FileInfo.from_path(file_path)
+                    if info is not None and self.should_process(info):
+                        self.submit(info)
+                except Exception:
+                    logger.exception(f"✗ FAILED {Path(file_path).name}")
+            
+            # Keep watch mode output live despite the buffered log handler
+            _flush_log()
+    
+    def stop(self):
         """
-        Called when a file is modified
+        Stop the debounce thread and wait for queued compressions
         
-        We check if it's a newly rotated file that should be compressed
+        Pending (not yet debounced) events are dropped.
         """
-        if event.is_directory:
-            return
-        
-        # Only process if it looks like a rotated log
-        if '.log.' in event.src_path and self.should_process(event.src_path):
-            self.compress_file(event.src_path)
+        self._stop.set()
+        if self._debounce_thread is not None:
+            self._debounce_thread.join()
+        self.pool.shutdown(wait=True)
     
     def print_stats(self):
         """Print compression statistics"""
+        _flush_log()
         print()
         print("=" * 70)
         print("Compression Statistics")
@@ -243,12 +658,142 @@ class LogCompressionHandler(FileSystemEventHandler):
         print("=" * 70)
 
 
+class SharedInotifyWatcher:
+    """
+    Process-wide inotify instance shared by every watched directory
+    
+    Each directory gets a watch descriptor on the same inotify fd instead of
+    its own instance and thread, so watching many directories never runs
+    into fs.inotify.max_user_instances. A single background thread reads the
+    fd and dispatches events to the handler registered for their wd.
+    """
+    
+    # Only the events that mean "a rotated file is complete": the writer
+    # closed it (copytruncate / create) or it was renamed into the directory.
+    # IN_CREATE is left out because it fires before any data is written.
+    MASK = (flags.CLOSE_WRITE | flags.MOVED_TO) if INOTIFY_AVAILABLE else 0
+    
+    def __init__(self):
+        self.inotify = INotify()
+        self.handlers: Dict[int, Tuple[Path, LogCompressionHandler]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def add_watch(self, log_dir: str, handler: LogCompressionHandler) -> int:
+        """
+        Watch a directory and route its events to a handler
+        
+        Args:
+            log_dir: Directory to monitor (non-recursive)
+            handler: Handler receiving the file paths
+        
+        Returns:
+            inotify watch descriptor
+        """
+        wd = self.inotify.add_watch(log_dir, self.MASK)
+        with self._lock:
+            self.handlers[wd] = (Path(log_dir).absolute(), handler)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="inotify-dispatch", daemon=True)
+                self._thread.start()
+        return wd
+    
+    def _run(self):
+        """Read events from the shared fd and dispatch them by watch descriptor"""
+        while not self._stop.is_set():
+            for event in self.inotify.read(timeout=1000):
+                # Drop directories and non-log names (e.g. our own .lsc output)
+                # before taking the lock or touching the handler
+                if event.mask & flags.ISDIR or not _is_log_name(event.name):
+                    continue
+                with self._lock:
+                    entry = self.handlers.get(event.wd)
+                if entry is None:
+                    continue
+                log_dir, handler = entry
+                handler.on_file_event(str(log_dir / event.name))
+    
+    def stop(self):
+        """Ask the dispatch thread to exit (within one read timeout)"""
+        self._stop.set()
+    
+    def join(self):
+        """Wait for the dispatch thread to exit"""
+        if self._thread is not None:
+            self._thread.join()
+
+
+_shared_watcher: Optional[SharedInotifyWatcher] = None
+
+
+def get_shared_watcher() -> SharedInotifyWatcher:
+    """Return the process-wide inotify watcher, creating it on first use"""
+    global _shared_watcher
+    if _shared_watcher is None:
+        _shared_watcher = SharedInotifyWatcher()
+    return _shared_watcher
+
+
+def start_watchdog_observer(log_dir: str, handler: LogCompressionHandler):
+    """
+    Fallback watcher for platforms without inotify (macOS, Windows)
+    
+    Args:
+        log_dir: Directory to monitor (non-recursive)
+        handler: Handler receiving the file paths
+    
+    Returns:
+        Started watchdog Observer
+    """
+    from watchdog.observers import Observer
+    from watchdog.events import (
+        FileSystemEventHandler, FileClosedEvent, FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+    )
+    
+    # Only watchdog's inotify emitter reports closed files
+    try:
+        from watchdog.observers.inotify import InotifyObserver
+        emits_closed = issubclass(Observer, InotifyObserver)
+    except ImportError:
+        emits_closed = False
+    
+    class WatchdogBridge(FileSystemEventHandler):
+        def on_closed(self, event):
+            # Writer released the file, so it is complete
+            if not event.is_directory and _is_log_name(os.path.basename(event.src_path)):
+                handler.on_file_event(event.src_path)
+        
+        def on_moved(self, event):
+            # Rotation by rename: the file is complete under its new name
+            if not event.is_directory and _is_log_name(os.path.basename(event.dest_path)):
+                handler.on_file_event(event.dest_path)
+        
+        # Without close events, writes are the only sign of copytruncate
+        # copies and created files; the debounce waits until they stop
+        on_created = on_closed
+        on_modified = on_closed
+    
+    # Only the events used are queued; everything else is dropped inside
+    # watchdog's emitter
+    event_filter = [FileClosedEvent, FileMovedEvent]
+    if not emits_closed:
+        event_filter += [FileCreatedEvent, FileModifiedEvent]
+    
+    observer = Observer()
+    observer.schedule(WatchdogBridge(), log_dir, recursive=False, event_filter=event_filter)
+    observer.start()
+    return observer
+
+
 def watch_directory(
     log_dir: str,
     output_dir: str,
     min_support: int = 3,
     delete_original: bool = False,
-    min_size_kb: int = 10
+    min_size_kb: int = 10,
+    debounce_sec: float = 2.0,
+    jobs: Optional[int] = None
 ):
     """
     Watch a directory for new log files and compress them automatically
@@ -259,6 +804,8 @@ def watch_directory(
         min_support: Minimum logs per template
         delete_original: Whether to delete original after compression
         min_size_kb: Minimum file size to compress (KB)
+        debounce_sec: Quiet period before a file event is acted on (seconds)
+        jobs: Maximum concurrent compressions (default: CPU count)
     """
     print("=" * 70)
     print("LogPress Log Rotation Handler")
@@ -269,30 +816,37 @@ def watch_directory(
     print(f"Min support: {min_support}")
     print(f"Delete orig: {delete_original}")
     print(f"Min size:    {min_size_kb} KB")
+    print(f"Debounce:    {debounce_sec}s")
+    print(f"Jobs:        {jobs or os.cpu_count()}")
     print()
     print("Press CTRL+C to stop")
     print("=" * 70)
     print()
     
-    # Create event handler and observer
+    # Create event handler and watcher
     event_handler = LogCompressionHandler(
         output_dir=output_dir,
         min_support=min_support,
         delete_original=delete_original,
-        min_size_kb=min_size_kb
+        min_size_kb=min_size_kb,
+        debounce_sec=debounce_sec,
+        max_workers=jobs
     )
     
-    observer = Observer()
-    observer.schedule(event_handler, log_dir, recursive=False)
-    observer.start()
+    if INOTIFY_AVAILABLE:
+        watcher = get_shared_watcher()
+        watcher.add_watch(log_dir, event_handler)
+    else:
+        watcher = start_watchdog_observer(log_dir, event_handler)
     
     try:
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
         print("\n\nStopping...")
-        observer.stop()
-        observer.join()
+        watcher.stop()
+        watcher.join()
+        event_handler.stop()
         
         # Print final statistics
         event_handler.print_stats()
@@ -304,7 +858,8 @@ def compress_existing_files(
     output_dir: str,
     min_support: int = 3,
     delete_original: bool = False,
-    min_size_kb: int = 10
+    min_size_kb: int = 10,
+    jobs: Optional[int] = None
 ):
     """
     Compress all existing log files in a directory (one-time operation)
@@ -314,12 +869,16 @@ def compress_existing_files(
     - Cron job integration
     - Logrotate postrotate script
     
+    Files are independent and compression is CPU-bound, so they are spread
+    over a process pool (one LogPress instance per task).
+    
     Args:
         log_dir: Directory containing log files
         output_dir: Directory to store compressed files
         min_support: Minimum logs per template
         delete_original: Whether to delete original after compression
         min_size_kb: Minimum file size to compress (KB)
+        jobs: Maximum worker processes (default: CPU count, 1 = serial)
     """
     print("=" * 70)
     print("LogPress Batch Compression")
@@ -330,6 +889,7 @@ def compress_existing_files(
     print(f"Min support: {min_support}")
     print(f"Delete orig: {delete_original}")
     print(f"Min size:    {min_size_kb} KB")
+    print(f"Jobs:        {jobs or os.cpu_count()}")
     print("=" * 70)
     print()
     
@@ -340,25 +900,67 @@ def compress_existing_files(
         min_size_kb=min_size_kb
     )
     
-    # Find all log files
-    log_files = []
-    for ext in ['.log', '.log.[0-9]*']:
-        log_files.extend(Path(log_dir).glob(f'*{ext}'))
-    
-    # Remove duplicates and sort
-    log_files = sorted(set(log_files))
+    # Find all log files in a single directory pass
+    # Absolute paths keep journal entries independent of the working directory
+    with os.scandir(os.path.abspath(log_dir)) as it:
+        infos = [
+            FileInfo.from_entry(entry) for entry in it
+            if _is_log_name(entry.name) and entry.is_file(follow_symlinks=False)
+        ]
+    log_files = sorted((info for info in infos if info is not None), key=lambda info: info.path)
     
     print(f"Found {len(log_files)} log files to process\n")
     
-    # Process each file
-    for log_file in log_files:
-        if handler.should_process(str(log_file)):
-            handler.compress_file(str(log_file))
+    # Deciding for every file up front is safe: each archive name belongs
+    # to a single path, so no two tasks can write (or skip) the same output
+    pending = [info for info in log_files if handler.should_process(info)]
+    
+    # Never start more workers than there are files to compress
+    max_workers = min(jobs or os.cpu_count() or 1, len(pending))
+    
+    if max_workers <= 1:
+        for info in pending:
+            handler.compress_file(info)
+    else:
+        with _make_pool(max_workers) as pool:
+            futures = {
+                pool.submit(_compress_one, str(info.path), output_dir, min_support, delete_original): str(info.path)
+                for info in pending
+            }
+            for future in as_completed(futures):
+                handler.record_result(_result_of(future, futures[future]))
     
     # Print statistics
     handler.print_stats()
 
 
+def _setup_logging(verbose: bool = False):
+    """
+    Send per-file progress to stdout through a buffer
+    
+    Lines are written in batches of up to 100 (or immediately for errors)
+    instead of one write() per file, so large batch runs are not slowed down
+    by stdout and output from parallel completions does not interleave.
+    
+    Args:
+        verbose: Also report files as they are queued/started
+    """
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter('%(message)s'))
+    buffer = logging.handlers.MemoryHandler(
+        capacity=100, flushLevel=logging.ERROR, target=stream
+    )
+    logger.addHandler(buffer)
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
+
+
+def _flush_log():
+    """Write out any buffered progress lines"""
+    for handler in logger.handlers:
+        handler.flush()
+
+
 def main():
     """Main entry point with CLI argument parsing"""
     parser = argparse.ArgumentParser(
@@ -375,6 +977,9 @@ Examples:
   # Watch and delete originals after compression
   python 09_log_rotation_handler.py --delete /var/log/myapp /var/log/compressed
 
+  # Compress existing logs with at most 4 worker processes
+  python 09_log_rotation_handler.py --once --jobs 4 /var/log/myapp /var/log/compressed
+
   # Custom minimum template support
   python 09_log_rotation_handler.py --min-support 5 /var/log/myapp /var/log/compressed
         """
@@ -418,7 +1023,28 @@ Examples:
         help='Minimum file size to compress in KB (default: 10)'
     )
     
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=2.0,
+        help='Seconds a file must be quiet before it is compressed in watch mode (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes used to compress files (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Also report each file as it is queued/started'
+    )
+    
     args = parser.parse_args()
+    _setup_logging(args.verbose)
     
     # Validate directories
     if not os.path.isdir(args.log_dir):
@@ -433,7 +1059,8 @@ Examples:
             output_dir=args.output_dir,
             min_support=args.min_support,
             delete_original=args.delete,
-            min_size_kb=args.min_size
+            min_size_kb=args.min_size,
+            jobs=args.jobs
         )
     else:
         # Watch mode
@@ -442,7 +1069,9 @@ Examples:
             output_dir=args.output_dir,
             min_support=args.min_support,
             delete_original=args.delete,
-            min_size_kb=args.min_size
+            min_size_kb=args.min_size,
+            debounce_sec=args.debounce,
+            jobs=args.jobs
         )
 
 
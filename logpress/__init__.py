@@ -23,22 +23,62 @@ MCP Architecture:
 - CLI: User interface (compress, query commands)
 """
 
-__version__ = "1.0.7"
+__version__ = "2.0.1"
 __author__ = "Adam Bouafia"
 __license__ = "MIT"
 
-# High-level API (recommended for most users)
-from logpress.api import LogPress, compress, query
+import importlib
+from typing import TYPE_CHECKING
 
-# Core MCP layers (advanced usage)
-from logpress import models, protocols
-from logpress.context import LogTokenizer, Tokenizer, TemplateGenerator, SemanticTypeRecognizer, SemanticFieldClassifier
-from logpress.services import SemanticCompressor, Compressor, QueryEngine, SchemaEvaluator, Evaluator, SchemaVersioner
+# Public names and the submodule that defines them. Submodules are imported
+# on first attribute access (PEP 562), so `import logpress` and the CLI's
+# --help don't pay for the compression stack until it is actually used.
+_LAZY_ATTRS = {
+    # High-level API (recommended for most users)
+    'LogPress': 'logpress.api',
+    'compress': 'logpress.api',
+    'query': 'logpress.api',
+    
+    # Core MCP layers (advanced usage)
+    'LogTokenizer': 'logpress.context',
+    'Tokenizer': 'logpress.context',
+    'TemplateGenerator': 'logpress.context',
+    'SemanticTypeRecognizer': 'logpress.context',
+    'SemanticFieldClassifier': 'logpress.context',
+    'SemanticCompressor': 'logpress.services',
+    'Compressor': 'logpress.services',
+    'QueryEngine': 'logpress.services',
+    'SchemaEvaluator': 'logpress.services',
+    'Evaluator': 'logpress.services',
+    'SchemaVersioner': 'logpress.services',
+}
+_LAZY_SUBMODULES = {'api', 'context', 'models', 'protocols', 'services'}
+
+if TYPE_CHECKING:
+    # Static view of the lazy names for type checkers and IDEs
+    from logpress.api import LogPress, compress, query
+    from logpress import api, context, models, protocols, services
+    from logpress.context import LogTokenizer, Tokenizer, TemplateGenerator, SemanticTypeRecognizer, SemanticFieldClassifier
+    from logpress.services import SemanticCompressor, Compressor, QueryEngine, SchemaEvaluator, Evaluator, SchemaVersioner
+
+
+def __getattr__(name):
+    """Import the submodule behind a public name on first access"""
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f'{__name__}.{name}')
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Legacy compatibility aliases
-LogTokenizer = LogTokenizer
-SemanticTypeRecognizer = SemanticTypeRecognizer
-SchemaEvaluator = SchemaEvaluator
 
 __all__ = [
     # High-level API (⭐ Start here!)
@@ -5,14 +5,57 @@ This module provides a simplified interface for common use cases.
 For advanced control, use the lower-level components directly.
 """
 
-from typing import List, Dict, Optional, Union, Tuple
+from typing import Iterator, List, Dict, Optional, Union, Tuple
 from pathlib import Path
-import tempfile
 
 from logpress.services import Compressor, QueryEngine
 from logpress.models import CompressedLog
 
 
+# Bytes read and decoded per step
+_READ_BLOCK_SIZE = 1 << 20
+
+
+def _iter_log_lines(path: Path) -> Iterator[str]:
+    """
+    Yield stripped, non-empty lines of a log file
+    
+    The file is read in ~1 MiB blocks cut at line boundaries, so UTF-8
+    decoding and line splitting happen per block instead of per line and
+    memory stays bounded regardless of file size. Lines end at \n, \r\n
+    or a lone \r, like a file opened in text mode. Plain reads (not mmap)
+    keep a file truncated mid-read, e.g. by copytruncate, a clean EOF.
+    """
+    with open(path, 'rb') as f:
+        # Unfinished line carried over from earlier blocks
+        tail: List[bytes] = []
+        while True:
+            block = f.read(_READ_BLOCK_SIZE)
+            if block:
+                # A \r\n split by the cut only adds an empty line, which is skipped
+                cut = max(block.rfind(b'\n'), block.rfind(b'\r'))
+                if cut == -1:
+                    # Line longer than one block: keep reading until it ends
+                    tail.append(block)
+                    continue
+                tail.append(block[:cut + 1])
+                data = b''.join(tail)
+                tail = [block[cut + 1:]]
+            else:
+                data = b''.join(tail)
+            
+            text = data.decode('utf-8', 'ignore')
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            for line in text.split('\n'):
+                line = line.strip()
+                if line:
+                    yield line
+            
+            if not block:
+                return
+
+
 class LogPress:
     """
     High-level unified API for log compression and querying
@@ -78,17 +121,17 @@ class LogPress:
         if not input_path.exists():
             raise FileNotFoundError(f"Input file not found: {input_path}")
         
-        # Read logs
-        with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
-            logs = [line.strip() for line in f if line.strip()]
-        
-        # Compress
-        compressed, stats = self.compressor.compress(logs)
+        # Don't keep the previous file's data alive while compressing this one
+        self.compressor.reset()
         
-        # Save (compressor retains compressed_data internally)
-        self.compressor.save(Path(output_path))
+        # Stream logs straight from the file into the compressor
+        compressed, stats = self.compressor.compress_iter(
+            _iter_log_lines(input_path), verbose=show_progress
+        )
         
-        output_size = Path(output_path).stat().st_size
+        # Save (compressor retains compressed_data internally), then release it
+        output_size = self.compressor.save(Path(output_path), verbose=show_progress)
+        self.compressor.reset()
         
         return {
             'compression_ratio': stats.compression_ratio,
@@ -142,16 +185,10 @@ class LogPress:
             >>> data = lp.compress_to_bytes(logs)
             >>> # Send over network or save to database
         """
-        compressed, _ = self.compressor.compress(logs)
-        
-        # Save to temporary file and read bytes
-        with tempfile.NamedTemporaryFile(suffix='.lsc', delete=False) as tmp:
-            self.compressor.save(compressed, tmp.name)
-            with open(tmp.name, 'rb') as f:
-                data = f.read()
-            Path(tmp.name).unlink()
+        self.compressor.compress(logs)
         
-        return data
+        # Encode in memory (same bytes save() would write)
+        return self.compressor.serialize()
     
     def query(
         self,
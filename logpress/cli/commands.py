@@ -5,7 +5,6 @@ CLI commands for logpress.
 import click
 import sys
 from pathlib import Path
-from logpress.services import SemanticCompressor
 
 @click.command()
 @click.option('--input', '-i', required=True, help='Input log file path')
@@ -20,6 +19,7 @@ def compress(input, output, measure, min_support):
         logpress compress -i datasets/Apache/Apache_full.log -o compressed/apache.lsc -m
     """
     import time
+    from logpress.services import SemanticCompressor
     input_path = Path(input)
     output_path = Path(output)
     
@@ -6,25 +6,35 @@ Interactive CLI menu for logpress using rich library
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.tree import Tree
-from rich.layout import Layout
 from rich import box
 from pathlib import Path
-import time
+import os
+import importlib.util
+from concurrent.futures import Future
+from contextlib import nullcontext
+import threading
 import shutil
 import subprocess
 import sys
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
-# Import logpress components
-from logpress.services.compressor import SemanticCompressor
+# Compression components and rich.progress are imported where they are
+# used, so opening the menu doesn't pay for them
 
 console = Console()
 
 
+def _list_files(path: str) -> Dict[str, os.DirEntry]:
+    """Map file name -> DirEntry for the files directly inside path"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it if entry.is_file()}
+    except OSError:
+        return {}
+
+
 @dataclass
 class Dataset:
     """Dataset information"""
@@ -37,70 +47,172 @@ class Dataset:
 class InteractiveCLI:
     """Interactive CLI for logpress with rich UI"""
     
+    # Python package availability, checked once per session
+    _pkg_cache: Dict[str, bool] = {}
+    
     def __init__(self):
         self.data_dir = Path("data/datasets")
         self.compressed_dir = Path("evaluation/compressed")
         self.results_dir = Path("evaluation/results")
-        self.datasets: List[Dataset] = []
+        self._datasets: List[Dataset] = []
+        self._datasets_future: Optional[Future] = None
         self.settings = {
             'min_support': 3,
             'zstd_level': 15,
             'measure': True,
             'enable_bwt': True,
         }
+        
+        # Menu chrome never changes, so build it once instead of on every redraw
+        self._header_panel = Panel.fit(
+            "[bold cyan]logpress - Log Compression System[/bold cyan]\n"
+            "[dim]Semantic-Aware Compression & Schema Extraction[/dim]",
+            border_style="purple",
+            box=box.DOUBLE
+        )
+        
+        actions_table = Table(show_header=False, box=None, padding=(0, 2))
+        actions_table.add_column("Key", style="yellow")
+        actions_table.add_column("Action", style="white")
+        
+        actions_table.add_row("[1]", "🗜️  Compress selected datasets")
+        actions_table.add_row("[2]", "🔍 Query compressed files")
+        actions_table.add_row("[3]", "📊 Run full evaluation")
+        actions_table.add_row("[4]", "⚖️  Comprehensive benchmarks (gzip, bzip2, xz, zstd, lz4, logreduce)")
+        actions_table.add_row("[5]", "📈 View results")
+        actions_table.add_row("[6]", "⚙️  Settings")
+        actions_table.add_row("[7]", "📦 Install benchmark tools")
+        actions_table.add_row("[0]", "🚪 Exit")
+        
+        self._actions_panel = Panel(actions_table, title="[bold green]🎬 Actions[/bold green]", border_style="green")
+        
+        self._install_help_panel = Panel.fit(
+            "[bold yellow]Installation Instructions[/bold yellow]\n\n"
+            "[cyan]System Tools:[/cyan]\n"
+            "  Ubuntu/Debian: [white]sudo apt install bzip2 xz-utils zstd liblz4-tool[/white]\n"
+            "  macOS:         [white]brew install bzip2 xz zstd lz4[/white]\n"
+            "  Arch Linux:    [white]sudo pacman -S bzip2 xz zstd lz4[/white]\n\n"
+            "[cyan]Python Tools:[/cyan]\n"
+            "  logreduce:     [white]pip install logreduce[/white]\n\n"
+            "[dim]Note: gzip is usually pre-installed on most systems[/dim]",
+            border_style="yellow"
+        )
+        
+        self._install_commands_panel = Panel(
+            "[bold]System Tool Installation Commands[/bold]\n\n"
+            "[yellow]Ubuntu/Debian:[/yellow]\n"
+            "sudo apt update\n"
+            "sudo apt install bzip2 xz-utils zstd liblz4-tool\n\n"
+            "[yellow]macOS (Homebrew):[/yellow]\n"
+            "brew install bzip2 xz zstd lz4\n\n"
+            "[yellow]Arch Linux:[/yellow]\n"
+            "sudo pacman -S bzip2 xz zstd lz4\n\n"
+            "[yellow]Fedora/RHEL:[/yellow]\n"
+            "sudo dnf install bzip2 xz zstd lz4",
+            border_style="blue"
+        )
+    
+    @property
+    def datasets(self) -> List[Dataset]:
+        """Detected datasets; waits for the startup scan if it is still running"""
+        future = self._datasets_future
+        if future is not None:
+            waiting = console.status("[cyan]Scanning datasets...[/cyan]") if not future.done() else nullcontext()
+            with waiting:
+                result = future.result()
+            self._datasets_future = None
+            self._datasets = self._report_scan(*result)
+        return self._datasets
+    
+    @datasets.setter
+    def datasets(self, datasets: List[Dataset]):
+        self._datasets_future = None
+        self._datasets = datasets
     
     def scan_datasets(self) -> List[Dataset]:
         """Scan data/datasets/ for available log files"""
-        datasets = []
+        with console.status("[cyan]Scanning datasets...[/cyan]"):
+            result = self._find_datasets()
+        return self._report_scan(*result)
+    
+    def _start_scan(self) -> Future:
+        """
+        Run _find_datasets on a daemon thread
         
-        if not self.data_dir.exists():
-            console.print(f"[red]Error: {self.data_dir} not found![/red]")
-            return datasets
+        Daemon, so Ctrl+C during the scan exits right away instead of
+        waiting at interpreter shutdown for every dataset to be counted.
         
-        with console.status("[cyan]Scanning datasets...[/cyan]"):
-            for dataset_dir in self.data_dir.iterdir():
-                if dataset_dir.is_dir():
-                    log_file = None
-                    
-                    # Try multiple naming patterns
-                    patterns = [
-                        dataset_dir / f"{dataset_dir.name}_full.log",  # Apache_full.log
-                        dataset_dir / f"{dataset_dir.name}.log",        # BGL.log
-                        dataset_dir / f"{dataset_dir.name.lower()}.log" # openstack.log
-                    ]
-                    
-                    for pattern in patterns:
-                        if pattern.exists():
-                            log_file = pattern
-                            break
+        Returns:
+            Future resolving to the _find_datasets result
+        """
+        future: Future = Future()
+        
+        def scan():
+            try:
+                future.set_result(self._find_datasets())
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=scan, name="scan-datasets", daemon=True).start()
+        return future
+    
+    @staticmethod
+    def _report_scan(datasets: List[Dataset], messages: List[str]) -> List[Dataset]:
+        """Print the scan's errors and warnings on the calling (main) thread"""
+        for message in messages:
+            console.print(message)
+        return datasets
+    
+    def _find_datasets(self) -> Tuple[List[Dataset], List[str]]:
+        """Find dataset log files (no output, safe to run off the main thread)
+        
+        Returns:
+            Sorted datasets and the messages to print for problems found
+        """
+        datasets = []
+        messages = []
+        
+        try:
+            with os.scandir(self.data_dir) as it:
+                dataset_dirs = [entry for entry in it if entry.is_dir()]
+        except FileNotFoundError:
+            messages.append(f"[red]Error: {self.data_dir} not found![/red]")
+            return datasets, messages
+        
+        for dataset_dir in dataset_dirs:
+            # One listing per dataset instead of an exists() per pattern
+            files = _list_files(dataset_dir.path)
+            
+            # Try multiple naming patterns
+            patterns = [
+                f"{dataset_dir.name}_full.log",  # Apache_full.log
+                f"{dataset_dir.name}.log",        # BGL.log
+                f"{dataset_dir.name.lower()}.log" # openstack.log
+            ]
+            log_entry = next((files[p] for p in patterns if p in files), None)
+            
+            if log_entry is not None:
+                try:
+                    lines = sum(1 for _ in open(log_entry.path, 'r', errors='ignore'))
+                    size_mb = log_entry.stat().st_size / (1024 * 1024)
                     
-                    if log_file and log_file.exists():
-                        try:
-                            lines = sum(1 for _ in open(log_file, 'r', errors='ignore'))
-                            size_mb = log_file.stat().st_size / (1024 * 1024)
-                            
-                            datasets.append(Dataset(
-                                name=dataset_dir.name,
-                                path=log_file,
-                                lines=lines,
-                                size_mb=size_mb
-                            ))
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Could not read {log_file}: {e}[/yellow]")
-        
-        return sorted(datasets, key=lambda x: x.name)
+                    datasets.append(Dataset(
+                        name=dataset_dir.name,
+                        path=Path(log_entry.path),
+                        lines=lines,
+                        size_mb=size_mb
+                    ))
+                except Exception as e:
+                    messages.append(f"[yellow]Warning: Could not read {log_entry.path}: {e}[/yellow]")
+        
+        return sorted(datasets, key=lambda x: x.name), messages
     
     def show_main_menu(self):
         """Display main menu with dataset listing"""
         console.clear()
         
         # Header
-        console.print(Panel.fit(
-            "[bold cyan]logpress - Log Compression System[/bold cyan]\n"
-            "[dim]Semantic-Aware Compression & Schema Extraction[/dim]",
-            border_style="purple",
-            box=box.DOUBLE
-        ))
+        console.print(self._header_panel)
         console.print()
         
         # Dataset table
@@ -127,29 +239,25 @@ class InteractiveCLI:
             console.print(table)
         else:
             console.print("[red]No datasets found in data/datasets/[/red]")
+            console.print("[yellow]You can still use other features.[/yellow]")
         
         console.print()
         
         # Actions menu
-        actions_table = Table(show_header=False, box=None, padding=(0, 2))
-        actions_table.add_column("Key", style="yellow")
-        actions_table.add_column("Action", style="white")
-        
-        actions_table.add_row("[1]", "🗜️  Compress selected datasets")
-        actions_table.add_row("[2]", "🔍 Query compressed files")
-        actions_table.add_row("[3]", "📊 Run full evaluation")
-        actions_table.add_row("[4]", "⚖️  Comprehensive benchmarks (gzip, bzip2, xz, zstd, lz4, logreduce)")
-        actions_table.add_row("[5]", "📈 View results")
-        actions_table.add_row("[6]", "⚙️  Settings")
-        actions_table.add_row("[7]", "📦 Install benchmark tools")
-        actions_table.add_row("[0]", "🚪 Exit")
-        
-        console.print(Panel(actions_table, title="[bold green]🎬 Actions[/bold green]", border_style="green"))
+        console.print(self._actions_panel)
         console.print()
         
-        choice = Prompt.ask("Select option", default="1")
+        choice = self._ask_option(["1", "2", "3", "4", "5", "6", "7", "0", "x"], default="1")
         self.handle_menu_choice(choice)
     
+    def _ask_option(self, options: List[str], default: str) -> str:
+        """Prompt until one of options is entered; re-asks in place on bad input"""
+        while True:
+            choice = Prompt.ask("Select option", default=default)
+            if choice.lower() in options:
+                return choice.lower()
+            console.print("[red]Invalid option![/red]")
+    
     def handle_menu_choice(self, choice: str):
         """Handle main menu selection"""
         try:
@@ -172,10 +280,9 @@ class InteractiveCLI:
                 exit(0)
             else:
                 console.print("[red]Invalid option![/red]")
-                time.sleep(1)
         except KeyboardInterrupt:
             console.print("\n[yellow]Operation cancelled[/yellow]")
-            time.sleep(1)
+            Prompt.ask("Press enter to continue")
     
     def compress_datasets(self):
         """Interactive dataset compression"""
@@ -249,6 +356,9 @@ class InteractiveCLI:
         
         console.print()
         
+        from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+        from logpress.services.compressor import SemanticCompressor
+        
         # Create output directory
         self.compressed_dir.mkdir(parents=True, exist_ok=True)
         
@@ -592,167 +702,133 @@ class InteractiveCLI:
             console.print("  [b]   Back to main menu")
             console.print()
             
-            choice = Prompt.ask("Select option", default="b")
+            choice = self._ask_option(["1", "2", "3", "4", "r", "b"], default="b")
             
             if choice == "1":
                 new_val = IntPrompt.ask("Min support (2-10)", default=self.settings['min_support'])
                 self.settings['min_support'] = max(2, min(10, new_val))
                 console.print(f"[green]✓ Min support set to {self.settings['min_support']}[/green]")
-                time.sleep(1)
             elif choice == "2":
                 new_val = IntPrompt.ask("Zstd level (1-22)", default=self.settings['zstd_level'])
                 self.settings['zstd_level'] = max(1, min(22, new_val))
                 console.print(f"[green]✓ Zstd level set to {self.settings['zstd_level']}[/green]")
-                time.sleep(1)
             elif choice == "3":
                 self.settings['enable_bwt'] = not self.settings['enable_bwt']
                 console.print(f"[green]✓ BWT {'enabled' if self.settings['enable_bwt'] else 'disabled'}[/green]")
-                time.sleep(1)
             elif choice == "4":
                 self.settings['measure'] = not self.settings['measure']
                 console.print(f"[green]✓ Metrics measurement {'enabled' if self.settings['measure'] else 'disabled'}[/green]")
-                time.sleep(1)
-            elif choice.lower() == "r":
+            elif choice == "r":
                 console.print("[cyan]Rescanning datasets...[/cyan]")
                 self.datasets = self.scan_datasets()
                 console.print(f"[green]✓ Found {len(self.datasets)} datasets[/green]")
-                time.sleep(1)
-            elif choice.lower() == "b":
+            elif choice == "b":
                 break
-            else:
-                console.print("[red]Invalid option![/red]")
-                time.sleep(1)
     
     def install_tools_menu(self):
         """Install or check benchmark tools"""
-        console.clear()
-        console.print(Panel("Install Benchmark Tools", style="cyan", box=box.DOUBLE))
-        console.print()
-        
-        # Check tool availability
-        tools_status = {
-            'System Tools': {
-                'gzip': shutil.which('gzip'),
-                'bzip2': shutil.which('bzip2'),
-                'xz': shutil.which('xz'),
-                'zstd': shutil.which('zstd'),
-                'lz4': shutil.which('lz4'),
-            },
-            'Python Tools': {
-                'logreduce': self._check_python_package('logreduce'),
+        while True:
+            console.clear()
+            console.print(Panel("Install Benchmark Tools", style="cyan", box=box.DOUBLE))
+            console.print()
+            
+            # Check tool availability
+            tools_status = {
+                'System Tools': {
+                    'gzip': shutil.which('gzip'),
+                    'bzip2': shutil.which('bzip2'),
+                    'xz': shutil.which('xz'),
+                    'zstd': shutil.which('zstd'),
+                    'lz4': shutil.which('lz4'),
+                },
+                'Python Tools': {
+                    'logreduce': self._check_python_package('logreduce'),
+                }
             }
-        }
-        
-        # Display status table
-        for category, tools in tools_status.items():
-            table = Table(title=f"📦 {category}", box=box.ROUNDED)
-            table.add_column("Tool", style="cyan", width=15)
-            table.add_column("Status", style="white", width=15)
-            table.add_column("Path/Version", style="dim")
             
-            for tool, status in tools.items():
-                if status:
-                    if category == 'Python Tools':
-                        table.add_row(tool, "[green]✓ Installed[/green]", "Python package")
+            # Display status table
+            for category, tools in tools_status.items():
+                table = Table(title=f"📦 {category}", box=box.ROUNDED)
+                table.add_column("Tool", style="cyan", width=15)
+                table.add_column("Status", style="white", width=15)
+                table.add_column("Path/Version", style="dim")
+                
+                for tool, status in tools.items():
+                    if status:
+                        if category == 'Python Tools':
+                            table.add_row(tool, "[green]✓ Installed[/green]", "Python package")
+                        else:
+                            table.add_row(tool, "[green]✓ Installed[/green]", status)
                     else:
-                        table.add_row(tool, "[green]✓ Installed[/green]", status)
-                else:
-                    table.add_row(tool, "[red]✗ Missing[/red]", "—")
-            
-            console.print(table)
-            console.print()
-        
-        # Installation instructions
-        console.print(Panel.fit(
-            "[bold yellow]Installation Instructions[/bold yellow]\n\n"
-            "[cyan]System Tools:[/cyan]\n"
-            "  Ubuntu/Debian: [white]sudo apt install bzip2 xz-utils zstd liblz4-tool[/white]\n"
-            "  macOS:         [white]brew install bzip2 xz zstd lz4[/white]\n"
-            "  Arch Linux:    [white]sudo pacman -S bzip2 xz zstd lz4[/white]\n\n"
-            "[cyan]Python Tools:[/cyan]\n"
-            "  logreduce:     [white]pip install logreduce[/white]\n\n"
-            "[dim]Note: gzip is usually pre-installed on most systems[/dim]",
-            border_style="yellow"
-        ))
-        console.print()
-        
-        # Options
-        console.print("[yellow]Options:[/yellow]")
-        console.print("  [1] Install logreduce (pip install logreduce)")
-        console.print("  [2] Show system tool install commands")
-        console.print("  [r] Refresh status")
-        console.print("  [b] Back to main menu")
-        console.print()
-        
-        choice = Prompt.ask("Select option", default="b")
-        
-        if choice == "1":
-            console.print()
-            console.print("[cyan]Installing logreduce...[/cyan]")
-            try:
-                result = subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "logreduce"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                console.print("[green]✓ logreduce installed successfully![/green]")
+                        table.add_row(tool, "[red]✗ Missing[/red]", "—")
+                
+                console.print(table)
                 console.print()
-                console.print(result.stdout)
-            except subprocess.CalledProcessError as e:
-                console.print(f"[red]✗ Installation failed: {e}[/red]")
-                console.print(e.stderr)
             
+            # Installation instructions
+            console.print(self._install_help_panel)
             console.print()
-            Prompt.ask("Press enter to continue")
-            self.install_tools_menu()  # Refresh
             
-        elif choice == "2":
-            console.print()
-            console.print(Panel(
-                "[bold]System Tool Installation Commands[/bold]\n\n"
-                "[yellow]Ubuntu/Debian:[/yellow]\n"
-                "sudo apt update\n"
-                "sudo apt install bzip2 xz-utils zstd liblz4-tool\n\n"
-                "[yellow]macOS (Homebrew):[/yellow]\n"
-                "brew install bzip2 xz zstd lz4\n\n"
-                "[yellow]Arch Linux:[/yellow]\n"
-                "sudo pacman -S bzip2 xz zstd lz4\n\n"
-                "[yellow]Fedora/RHEL:[/yellow]\n"
-                "sudo dnf install bzip2 xz zstd lz4",
-                border_style="blue"
-            ))
+            # Options
+            console.print("[yellow]Options:[/yellow]")
+            console.print("  [1] Install logreduce (pip install logreduce)")
+            console.print("  [2] Show system tool install commands")
+            console.print("  [r] Refresh status")
+            console.print("  [b] Back to main menu")
             console.print()
-            Prompt.ask("Press enter to continue")
-            self.install_tools_menu()  # Refresh
             
-        elif choice.lower() == "r":
-            self.install_tools_menu()  # Refresh
+            choice = self._ask_option(["1", "2", "r", "b"], default="b")
             
-        elif choice.lower() == "b":
-            return
-        else:
-            console.print("[red]Invalid option![/red]")
-            time.sleep(1)
-            self.install_tools_menu()  # Retry
+            if choice == "1":
+                console.print()
+                console.print("[cyan]Installing logreduce...[/cyan]")
+                try:
+                    result = subprocess.run(
+                        [sys.executable, "-m", "pip", "install", "logreduce"],
+                        capture_output=True,
+                        text=True,
+                        check=True
+                    )
+                    self._forget_python_packages()
+                    console.print("[green]✓ logreduce installed successfully![/green]")
+                    console.print()
+                    console.print(result.stdout)
+                except subprocess.CalledProcessError as e:
+                    console.print(f"[red]✗ Installation failed: {e}[/red]")
+                    console.print(e.stderr)
+                
+                console.print()
+                Prompt.ask("Press enter to continue")
+                
+            elif choice == "2":
+                console.print()
+                console.print(self._install_commands_panel)
+                console.print()
+                Prompt.ask("Press enter to continue")
+                
+            elif choice == "r":
+                self._forget_python_packages()
+                
+            elif choice == "b":
+                return
     
     def _check_python_package(self, package_name: str) -> bool:
-        """Check if a Python package is installed"""
-        try:
-            __import__(package_name)
-            return True
-        except ImportError:
-            return False
+        """Check if a Python package is installed (without importing it)"""
+        if package_name not in self._pkg_cache:
+            self._pkg_cache[package_name] = importlib.util.find_spec(package_name) is not None
+        return self._pkg_cache[package_name]
+    
+    def _forget_python_packages(self):
+        """Drop cached package checks, e.g. after installing something"""
+        self._pkg_cache.clear()
+        importlib.invalidate_caches()
     
     def run(self):
         """Main loop"""
-        # Scan datasets
-        self.datasets = self.scan_datasets()
-        
-        if not self.datasets:
-            console.print("[yellow]Warning: No datasets found in data/datasets/[/yellow]")
-            console.print("[yellow]You can still use other features.[/yellow]")
-            time.sleep(2)
+        # Scan datasets in the background while the first screen renders;
+        # the datasets property waits for the result when it is first used
+        # (the main menu reports when there are none)
+        self._datasets_future = self._start_scan()
         
         # Main loop
         while True:
@@ -763,7 +839,9 @@ class InteractiveCLI:
                 break
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]")
-                console.print_exception()
+                # Full traceback only on request (LOGPRESS_DEBUG=1)
+                if os.getenv("LOGPRESS_DEBUG"):
+                    console.print_exception()
                 Prompt.ask("Press enter to continue")
 
 
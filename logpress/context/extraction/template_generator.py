@@ -78,12 +78,13 @@ class TemplateGenerator:
         self.similarity_threshold = similarity_threshold
         self.templates: List[LogTemplate] = []
     
-    def extract_schemas(self, log_lines: List[str]) -> List[LogTemplate]:
+    def extract_schemas(self, log_lines: List[str], verbose: bool = True) -> List[LogTemplate]:
         """
         Extract schemas from a list of log entries
         
         Args:
             log_lines: List of raw log strings
+            verbose: Print progress information
             
         Returns:
             List of extracted templates, sorted by match count
@@ -92,7 +93,8 @@ class TemplateGenerator:
             return []
         
         # Step 1: Tokenize all logs
-        print(f"Tokenizing {len(log_lines)} logs...")
+        if verbose:
+            print(f"Tokenizing {len(log_lines)} logs...")
         tokenized_logs = []
         for i, log in enumerate(log_lines):
             if log.strip():
@@ -106,9 +108,11 @@ class TemplateGenerator:
                 })
         
         # Step 2: Group logs by structure (similar token counts and patterns)
-        print(f"Grouping {len(tokenized_logs)} logs by structure...")
+        if verbose:
+            print(f"Grouping {len(tokenized_logs)} logs by structure...")
         groups = self._group_by_structure(tokenized_logs)
-        print(f"Found {len(groups)} structural groups")
+        if verbose:
+            print(f"Found {len(groups)} structural groups")
         
         # Step 3: Generate templates for each group
         templates = []
@@ -17,9 +17,10 @@ import json
 import gzip
 import msgpack
 import zstandard as zstd
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from dataclasses import dataclass, field as dataclass_field
 from collections import defaultdict
+from itertools import chain, islice
 from pathlib import Path
 from datetime import datetime
 import time
@@ -46,6 +47,22 @@ def load_universal_dict() -> Optional[bytes]:
     return _UNIVERSAL_DICT
 
 
+# Zstd level used for the outer .lsc frame
+ZSTD_LEVEL = 15
+
+_UNIVERSAL_ZDICT = None
+
+def get_universal_zstd_dict() -> Optional[zstd.ZstdCompressionDict]:
+    """Universal dictionary digested once for ZSTD_LEVEL (shared by every save/load)"""
+    global _UNIVERSAL_ZDICT
+    if _UNIVERSAL_ZDICT is None:
+        raw = load_universal_dict()
+        if raw:
+            _UNIVERSAL_ZDICT = zstd.ZstdCompressionDict(raw)
+            _UNIVERSAL_ZDICT.precompute_compress(level=ZSTD_LEVEL)
+    return _UNIVERSAL_ZDICT
+
+
 def zigzag_encode(n: int) -> int:
     """Zigzag encoding for signed integers: maps negatives to positive odds"""
     if n >= 0:
@@ -330,6 +347,16 @@ class SemanticCompressor:
         self.enable_rle = enable_rle
         self.enable_token_pool = enable_token_pool
         self.enable_zstd = enable_zstd
+    
+    def reset(self):
+        """
+        Drop the result of the previous compression
+        
+        The template generator (tokenizer, semantic recognizer and their
+        compiled patterns) is kept, so one compressor can be reused across
+        many files without holding on to the last file's columns.
+        """
+        self.compressed_data = None
         
     def compress(self, log_lines: List[str], verbose: bool = True) -> Tuple[CompressedLog, CompressionStats]:
         """
@@ -339,18 +366,44 @@ class SemanticCompressor:
             log_lines: List of raw log strings
             verbose: Print progress information
             
+        Returns:
+            Tuple of (compressed_data, compression_stats)
+        """
+        # Templates are learned from every line, exactly as before
+        return self.compress_iter(log_lines, chunk_size=max(len(log_lines), 1), verbose=verbose)
+    
+    def compress_iter(self, log_lines: Iterable[str], chunk_size: int = 100_000,
+                      verbose: bool = True) -> Tuple[CompressedLog, CompressionStats]:
+        """
+        Compress logs from any iterable (e.g. a generator over a file)
+        
+        Templates are extracted from the first chunk_size lines; every line is
+        then matched and encoded as it is read, so peak memory is bounded by
+        the first chunk plus the encoded columns instead of the whole input.
+        
+        Args:
+            log_lines: Iterable of raw log strings (consumed once)
+            chunk_size: Number of leading lines used for schema extraction
+            verbose: Print progress information
+            
         Returns:
             Tuple of (compressed_data, compression_stats)
         """
         start_time = time.time()
         
+        log_iter = iter(log_lines)
+        first_chunk = list(islice(log_iter, chunk_size))
+        
         if verbose:
-            print(f"🗜️  Starting compression of {len(log_lines)} logs...")
+            if isinstance(log_lines, list):
+                print(f"🗜️  Starting compression of {len(log_lines)} logs...")
+            else:
+                print(f"🗜️  Starting streaming compression (schemas from first {len(first_chunk)} logs)...")
         
         # Step 1: Extract schemas
         if verbose:
             print(f"  [1/6] Extracting schemas (Custom Log Alignment Algorithm)...")
-        templates = self.generator.extract_schemas(log_lines)
+        templates = self.generator.extract_schemas(first_chunk, verbose=verbose)
         
         if not templates:
             raise ValueError("No templates extracted - cannot compress")
@@ -366,7 +419,6 @@ class SemanticCompressor:
         
         compressed = CompressedLog()
         compressed.version = '3.4'
-        compressed.original_count = len(log_lines)
         compressed.compressed_at = datetime.now().isoformat()
         
         # v3.0: Build token pool for template deduplication
@@ -413,12 +465,20 @@ class SemanticCompressor:
         log_index = []
         
         matched_count = 0
+        log_count = 0
+        original_size = 0
         
         # Step 3: Process each log and collect fields
         if verbose:
             print(f"  [3/6] Matching and collecting fields...")
         
-        for log_line in log_lines:
+        # Drop our reference so the first chunk is freed once chain() moves past it
+        lines = chain(first_chunk, log_iter)
+        del first_chunk
+        
+        for log_line in lines:
+            log_count += 1
+            original_size += len(log_line.encode('utf-8'))
             result = self.generator.match_log_to_template(log_line)
             
             if not result:
@@ -477,6 +537,8 @@ class SemanticCompressor:
             
             log_index.append((template_idx, field_indices))
         
+        compressed.original_count = log_count
+        
         # Step 4: Apply varint encoding to all integer arrays
         if verbose:
             print(f"  [4/6] Columnar Encoding (Delta + Zigzag + Varint)...")
@@ -571,7 +633,6 @@ class SemanticCompressor:
             compressed.zstd_dict = None
         
         # Calculate statistics
-        original_size = sum(len(log.encode('utf-8')) for log in log_lines)
         compressed_size = self._estimate_compressed_size(compressed)
         
         compression_time = time.time() - start_time
@@ -581,7 +642,7 @@ class SemanticCompressor:
             compressed_size=compressed_size,
             compression_ratio=original_size / compressed_size if compressed_size > 0 else 0,
             compression_time=compression_time,
-            log_count=len(log_lines),
+            log_count=log_count,
             template_count=len(templates)
         )
         
@@ -590,7 +651,7 @@ class SemanticCompressor:
             print(f"  • Original size: {original_size:,} bytes ({original_size/1024:.1f} KB)")
             print(f"  • Compressed size: {compressed_size:,} bytes ({compressed_size/1024:.1f} KB)")
             print(f"  • Compression ratio: {stats.compression_ratio:.2f}x")
-            print(f"  • Matched logs: {matched_count}/{len(log_lines)} ({matched_count/len(log_lines)*100:.1f}%)")
+            print(f"  • Matched logs: {matched_count}/{log_count} ({matched_count/log_count*100:.1f}%)")
             print(f"  • Time: {compression_time:.2f}s")
             print(f"  • Dictionaries: severity={len(severity_map)}, ip={len(ip_map)}, message={len(message_map)}")
         
@@ -680,7 +741,20 @@ class SemanticCompressor:
         
         return size
     
-    def save(self, filepath: Path, verbose: bool = False, use_bwt: bool = False):
+    def serialize(self, verbose: bool = False, use_bwt: bool = False) -> bytes:
+        """Encode compressed data to the .lsc byte format without touching disk
+        
+        Args:
+            verbose: Print compression statistics
+            use_bwt: Apply Burrows-Wheeler Transform before Zstd (default: False)
+            
+        Returns:
+            File contents as written by save()
+        """
+        compressed, _, _ = self._encode(verbose=verbose, use_bwt=use_bwt)
+        return compressed
+    
+    def save(self, filepath: Path, verbose: bool = False, use_bwt: bool = False) -> int:
         """Save optimized compressed data (varint + RLE + MessagePack + [BWT] + zstd)
         
         Args:
@@ -689,6 +763,32 @@ class SemanticCompressor:
             use_bwt: Apply Burrows-Wheeler Transform before Zstd (default: False)
                     BWT achieves 28.10x avg compression (+79.7% vs baseline)
                     but adds ~2s processing time per 5K logs
+        
+        Returns:
+            Number of bytes written
+        """
+        compressed, msgpack_size, pre_zstd_size = self._encode(verbose=verbose, use_bwt=use_bwt)
+        
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'wb') as f:
+            written = f.write(compressed)
+        
+        if verbose:
+            print(f"💾 Saved optimized compressed data to {filepath}")
+            print(f"   MessagePack size: {msgpack_size:,} bytes ({msgpack_size/1024:.1f} KB)")
+            if use_bwt:
+                print(f"   After BWT: {pre_zstd_size:,} bytes ({pre_zstd_size/1024:.1f} KB)")
+            print(f"   Final size: {len(compressed):,} bytes ({len(compressed)/1024:.1f} KB)")
+            print(f"   Zstd ratio: {pre_zstd_size / len(compressed):.2f}x")
+            print(f"   Overall ratio: {msgpack_size / len(compressed):.2f}x")
+        
+        return written
+    
+    def _encode(self, verbose: bool = False, use_bwt: bool = False) -> Tuple[bytes, int, int]:
+        """MessagePack + [BWT] + zstd encoding shared by save() and serialize()
+        
+        Returns:
+            Tuple of (encoded bytes, MessagePack size, size fed to zstd)
         """
         if not self.compressed_data:
             raise ValueError("No compressed data to save")
@@ -745,40 +845,24 @@ class SemanticCompressor:
         else:
             data_to_compress = msgpack_data
         
-        # Try to use universal dictionary first (trained from all datasets)
-        universal_dict = load_universal_dict()
+        # Use universal dictionary if available (trained from all datasets).
+        # The per-batch cd.zstd_dict is not used here: it lives inside this
+        # very frame, so a reader could never obtain it to decompress.
+        zdict = get_universal_zstd_dict()
         
-        if universal_dict:
-            # Use universal dictionary (better for cross-dataset compression)
-            zdict = zstd.ZstdCompressionDict(universal_dict)
-            cctx = zstd.ZstdCompressor(level=15, dict_data=zdict)
-            compressed = cctx.compress(data_to_compress)
-            if verbose:
-                print(f"   Using universal Zstd dictionary ({len(universal_dict):,} bytes)")
-        elif cd.zstd_dict:
-            # Fallback to per-batch trained dictionary
-            zdict = zstd.ZstdCompressionDict(cd.zstd_dict)
-            cctx = zstd.ZstdCompressor(level=15, dict_data=zdict)
+        if zdict is not None:
+            # Frame header records the dict ID, which load() uses to pick it
+            cctx = zstd.ZstdCompressor(level=ZSTD_LEVEL, dict_data=zdict)
             compressed = cctx.compress(data_to_compress)
             if verbose:
-                print(f"   Using per-batch Zstd dictionary ({len(cd.zstd_dict):,} bytes)")
+                print(f"   Using universal Zstd dictionary (id {zdict.dict_id()})")
         else:
             # No dictionary available
-            compressed = zstd.compress(data_to_compress, level=15)
+            compressed = zstd.compress(data_to_compress, level=ZSTD_LEVEL)
             if verbose:
                 print(f"   Using Zstd without dictionary")
         
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'wb') as f:
-            f.write(compressed)
-        
-        print(f"💾 Saved optimized compressed data to {filepath}")
-        print(f"   MessagePack size: {len(msgpack_data):,} bytes ({len(msgpack_data)/1024:.1f} KB)")
-        if use_bwt:
-            print(f"   After BWT: {len(data_to_compress):,} bytes ({len(data_to_compress)/1024:.1f} KB)")
-        print(f"   Final size: {len(compressed):,} bytes ({len(compressed)/1024:.1f} KB)")
-        print(f"   Zstd ratio: {len(data_to_compress) / len(compressed):.2f}x")
-        print(f"   Overall ratio: {len(msgpack_data) / len(compressed):.2f}x")
+        return compressed, len(msgpack_data), len(data_to_compress)
     
     @staticmethod
     def load(filepath: Path, use_bwt: bool = False) -> CompressedLog:
@@ -792,25 +876,20 @@ class SemanticCompressor:
         with open(filepath, 'rb') as f:
             compressed_bytes = f.read()
         
-        # Try decompression with universal dictionary first
-        universal_dict = load_universal_dict()
-        
-        if universal_dict:
-            try:
-                zdict = zstd.ZstdCompressionDict(universal_dict)
-                dctx = zstd.ZstdDecompressor(dict_data=zdict)
-                decompressed = dctx.decompress(compressed_bytes)
-            except:
-                # Fallback to no dictionary
-                decompressed = zstd.decompress(compressed_bytes)
+        # The frame header says which dictionary (if any) the writer used
+        dict_id = zstd.get_frame_parameters(compressed_bytes).dict_id
+        
+        if dict_id:
+            zdict = get_universal_zstd_dict()
+            if zdict is None or zdict.dict_id() != dict_id:
+                raise ValueError(f"{filepath} needs Zstd dictionary {dict_id}, which is not available")
+            decompressed = zstd.ZstdDecompressor(dict_data=zdict).decompress(compressed_bytes)
         else:
-            # Try new format first (single zstd layer)
-            try:
-                decompressed = zstd.decompress(compressed_bytes)
-            except:
-                # Fallback: try old format (zstd -> gzip)
-                gzipped = zstd.decompress(compressed_bytes)
-                decompressed = gzip.decompress(gzipped)
+            decompressed = zstd.decompress(compressed_bytes)
+        
+        # Old format: zstd -> gzip -> MessagePack
+        if decompressed[:2] == b'\x1f\x8b':
+            decompressed = gzip.decompress(decompressed)
         
         # Apply BWT inverse if needed
         if use_bwt:
@@ -1043,7 +1122,7 @@ if __name__ == "__main__":
     
     # Save
     output_path = Path(args.output)
-    compressor.save(output_path)
+    compressor.save(output_path, verbose=True)
     
     # Compare with gzip if requested
     if args.measure:
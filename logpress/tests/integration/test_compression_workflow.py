@@ -2,9 +2,11 @@
 Integration tests for compression workflow
 """
 
+import gzip
 import pytest
+import zstandard as zstd
 from pathlib import Path
-from logpress.services.compressor import SemanticCompressor
+from logpress.services.compressor import SemanticCompressor, get_universal_zstd_dict
 
 class TestCompressionWorkflow:
     """Test end-to-end compression workflow"""
@@ -25,10 +27,79 @@ class TestCompressionWorkflow:
         output_file = test_output_dir / "compressed" / "test.lsc"
         
         compressed_log, stats = compressor.compress(sample_logs, verbose=False)
-        compressor.save(output_file, verbose=False)
+        written = compressor.save(output_file, verbose=False)
         
         assert output_file.exists()
-        assert output_file.stat().st_size > 0
+        assert output_file.stat().st_size == written > 0
+    
+    def test_serialize_matches_saved_file(self, test_output_dir, sample_logs):
+        """Test in-memory serialization produces the same bytes as save()"""
+        compressor = SemanticCompressor(min_support=2)
+        output_file = test_output_dir / "compressed" / "serialized.lsc"
+        
+        compressor.compress(sample_logs, verbose=False)
+        compressor.save(output_file, verbose=False)
+        data = compressor.serialize()
+        
+        assert data == output_file.read_bytes()
+        assert SemanticCompressor.load(output_file).original_count == len(sample_logs)
+    
+    def test_compress_iter_streams_generator(self, sample_logs):
+        """Test streaming compression counts every line past the first chunk"""
+        compressor = SemanticCompressor(min_support=2)
+        lines = sample_logs * 20
+        
+        compressed_log, stats = compressor.compress_iter(
+            (line for line in lines), chunk_size=50, verbose=False
+        )
+        
+        assert stats.log_count == len(lines)
+        assert compressed_log.original_count == len(lines)
+        assert stats.original_size == sum(len(line.encode('utf-8')) for line in lines)
+    
+    def test_reset_releases_compressed_data(self, sample_logs):
+        """Test reset() drops the last result but keeps the generator"""
+        compressor = SemanticCompressor(min_support=2)
+        generator = compressor.generator
+        
+        compressor.compress(sample_logs, verbose=False)
+        compressor.reset()
+        
+        assert compressor.compressed_data is None
+        assert compressor.generator is generator
+        with pytest.raises(ValueError):
+            compressor.serialize()
+    
+    def test_load_legacy_gzip_payload(self, test_output_dir, sample_logs):
+        """Test files written as zstd(gzip(msgpack)) still load"""
+        compressor = SemanticCompressor(min_support=2)
+        current_file = test_output_dir / "compressed" / "current.lsc"
+        legacy_file = test_output_dir / "compressed" / "legacy.lsc"
+        
+        compressor.compress(sample_logs, verbose=False)
+        compressor.save(current_file, verbose=False)
+        msgpack_data = zstd.ZstdDecompressor(
+            dict_data=get_universal_zstd_dict()
+        ).decompress(current_file.read_bytes())
+        legacy_file.write_bytes(zstd.compress(gzip.compress(msgpack_data)))
+        
+        loaded = SemanticCompressor.load(legacy_file)
+        assert loaded.original_count == len(sample_logs)
+        assert loaded.templates == SemanticCompressor.load(current_file).templates
+    
+    def test_load_foreign_dictionary_raises(self, test_output_dir):
+        """Test a frame needing an unknown Zstd dictionary raises ValueError"""
+        samples = [f"2024-01-01 INFO foreign request id={i} user=u{i % 7}".encode() for i in range(2000)]
+        foreign = zstd.train_dictionary(4096, samples)
+        universal = get_universal_zstd_dict()
+        assert universal is None or foreign.dict_id() != universal.dict_id()
+        output_file = test_output_dir / "compressed" / "foreign.lsc"
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        output_file.write_bytes(zstd.ZstdCompressor(dict_data=foreign).compress(b"\n".join(samples)))
+        
+        with pytest.raises(ValueError, match=str(foreign.dict_id())):
+            SemanticCompressor.load(output_file)
     
     def test_compress_multiple_datasets(self, test_data_dir, test_output_dir):
         """Test compressing multiple datasets sequentially"""
@@ -0,0 +1,284 @@
+"""
+Integration tests for the log rotation handler example
+"""
+
+import importlib
+import json
+import os
+import sys
+import time
+import pytest
+from pathlib import Path
+
+pytest.importorskip("pybloom_live")
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[3] / "examples"
+
+
+@pytest.fixture(scope="module")
+def rotation():
+    """Import examples/09_log_rotation_handler.py by name, so pool workers can unpickle its functions"""
+    sys.path.insert(0, str(EXAMPLES_DIR))
+    try:
+        yield importlib.import_module("09_log_rotation_handler")
+    finally:
+        sys.path.remove(str(EXAMPLES_DIR))
+
+
+def write_log(path: Path, day: int, mtime: float):
+    """Write a small log whose content identifies the day it was rotated"""
+    path.write_text("".join(
+        f"2024-01-{day:02d} 10:00:{i % 60:02d} INFO day{day} request id={i}\n"
+        for i in range(200)
+    ))
+    os.utime(path, (mtime, mtime))
+
+
+class TestLogRotationHandler:
+    """Test that rotated logs never overwrite each other's archives"""
+    
+    def test_same_path_rotated_twice_keeps_both_archives(self, rotation, tmp_path):
+        """Test a reused app.log.1 gets its own archive on the next rotation"""
+        logs, out = tmp_path / "logs", tmp_path / "out"
+        logs.mkdir()
+        handler = rotation.LogCompressionHandler(
+            output_dir=str(out), delete_original=True, min_size_kb=0
+        )
+        try:
+            rotated = logs / "app.log.1"
+            
+            write_log(rotated, day=1, mtime=1_704_067_200)
+            info = rotation.FileInfo.from_path(str(rotated))
+            assert handler.should_process(info)
+            handler.compress_file(info)
+            assert not rotated.exists()
+            
+            (first,) = out.glob("*.lsc")
+            first_bytes = first.read_bytes()
+            
+            # Next day's rotation reuses the same path
+            write_log(rotated, day=2, mtime=1_704_153_600)
+            info = rotation.FileInfo.from_path(str(rotated))
+            assert handler.should_process(info)
+            handler.compress_file(info)
+            
+            assert len(list(out.glob("*.lsc"))) == 2
+            assert first.read_bytes() == first_bytes
+            assert handler.stats['files_processed'] == 2
+        finally:
+            handler.stop()
+    
+    def test_batch_delete_keeps_every_rotated_file(self, rotation, tmp_path):
+        """Test --once --delete archives app.log.1 and app.log.2 separately"""
+        logs, out = tmp_path / "logs", tmp_path / "out"
+        logs.mkdir()
+        write_log(logs / "app.log.1", day=2, mtime=1_704_153_600)
+        write_log(logs / "app.log.2", day=1, mtime=1_704_067_200)
+        
+        rotation.compress_existing_files(
+            str(logs), str(out), delete_original=True, min_size_kb=0, jobs=1
+        )
+        
+        archives = sorted(p.name for p in out.glob("*.lsc"))
+        assert len(archives) == 2
+        assert archives[0].startswith("app.log.1.")
+        assert archives[1].startswith("app.log.2.")
+        assert list(logs.iterdir()) == []
+    
+    def test_watch_mode_survives_dead_worker(self, rotation, tmp_path):
+        """Test a worker killed mid-run does not stop later compressions"""
+        logs, out = tmp_path / "logs", tmp_path / "out"
+        logs.mkdir()
+        handler = rotation.LogCompressionHandler(
+            output_dir=str(out), min_size_kb=0, debounce_sec=0, max_workers=1
+        )
+        try:
+            # Break the pool the way an OOM kill would
+            with pytest.raises(Exception):
+                handler.pool.submit(os._exit, 1).result()
+            
+            rotated = logs / "app.log.1"
+            write_log(rotated, day=1, mtime=1_704_067_200)
+            handler.on_file_event(str(rotated))
+            
+            deadline = time.monotonic() + 60
+            while handler.stats['files_processed'] == 0 and time.monotonic() < deadline:
+                time.sleep(0.1)
+            
+            assert handler.stats['files_processed'] == 1
+            assert handler._in_flight == set()
+        finally:
+            handler.stop()
+    
+    def test_growing_log_replaces_its_archive(self, rotation, tmp_path):
+        """Test repeated --once runs over a live app.log keep one up-to-date archive"""
+        logs, out = tmp_path / "logs", tmp_path / "out"
+        logs.mkdir()
+        live = logs / "app.log"
+        
+        write_log(live, day=1, mtime=1_704_067_200)
+        rotation.compress_existing_files(str(logs), str(out), min_size_kb=0, jobs=1)
+        (archive,) = out.glob("*.lsc")
+        assert archive.name == "app.log.lsc"
+        assert archive.stat().st_mtime_ns == live.stat().st_mtime_ns
+        first_bytes = archive.read_bytes()
+        
+        # Unchanged log: nothing is rewritten
+        rotation.compress_existing_files(str(logs), str(out), min_size_kb=0, jobs=1)
+        assert archive.read_bytes() == first_bytes
+        
+        # The log grew: its single archive is replaced
+        write_log(live, day=2, mtime=1_704_153_600)
+        rotation.compress_existing_files(str(logs), str(out), min_size_kb=0, jobs=1)
+        assert [p.name for p in out.glob("*.lsc")] == ["app.log.lsc"]
+        assert archive.read_bytes() != first_bytes
+        assert archive.stat().st_mtime_ns == live.stat().st_mtime_ns
+    
+    def test_rewrite_within_one_second_is_compressed(self, rotation, tmp_path):
+        """Test versions of a file under a second apart are told apart"""
+        logs, out = tmp_path / "logs", tmp_path / "out"
+        logs.mkdir()
+        handler = rotation.LogCompressionHandler(
+            output_dir=str(out), delete_original=True, min_size_kb=0
+        )
+        try:
+            rotated = logs / "app.log.1"
+            mtime_ns = 1_704_067_200_000_000_000
+            
+            write_log(rotated, day=1, mtime=0)
+            os.utime(rotated, ns=(mtime_ns, mtime_ns))
+            handler.compress_file(rotation.FileInfo.from_path(str(rotated)))
+            
+            write_log(rotated, day=2, mtime=0)
+            os.utime(rotated, ns=(mtime_ns + 500_000_000, mtime_ns + 500_000_000))
+            info = rotation.FileInfo.from_path(str(rotated))
+            assert handler.should_process(info)
+            handler.compress_file(info)
+            
+            assert len(list(out.glob("*.lsc"))) == 2
+        finally:
+            handler.stop()
+
+
+class TestProcessedJournal:
+    """Test the .processed.jsonl journal of compressed file versions"""
+    
+    def journal_line(self, path: Path, mtime_ns: int) -> str:
+        """One journal entry as written by the handler"""
+        return json.dumps({'path': str(path), 'mtime_ns': mtime_ns, 'ts': 0.0}) + "\n"
+    
+    def test_reload_skips_version_whose_output_was_removed(self, rotation, tmp_path):
+        """Test a new handler remembers versions compressed by an earlier one"""
+        logs, out = tmp_path / "logs", tmp_path / "out"
+        logs.mkdir()
+        rotated = logs / "app.log.1"
+        write_log(rotated, day=1, mtime=1_704_067_200)
+        
+        first = rotation.LogCompressionHandler(output_dir=str(out), min_size_kb=0)
+        first.compress_file(rotation.FileInfo.from_path(str(rotated)))
+        first.stop()
+        for archive in out.glob("*.lsc"):
+            archive.unlink()
+        
+        second = rotation.LogCompressionHandler(output_dir=str(out), min_size_kb=0)
+        try:
+            assert not second.should_process(rotation.FileInfo.from_path(str(rotated)))
+            
+            # A new version of the same path is compressed again
+            write_log(rotated, day=2, mtime=1_704_153_600)
+            assert second.should_process(rotation.FileInfo.from_path(str(rotated)))
+        finally:
+            second.stop()
+    
+    def test_torn_lines_are_ignored(self, rotation, tmp_path):
+        """Test damaged journal lines are skipped and good ones still count"""
+        logs, out = tmp_path / "logs", tmp_path / "out"
+        logs.mkdir()
+        out.mkdir()
+        rotated = logs / "app.log.1"
+        write_log(rotated, day=1, mtime=1_704_067_200)
+        info = rotation.FileInfo.from_path(str(rotated))
+        
+        (out / ".processed.jsonl").write_text(
+            "not json\n"
+            + json.dumps({'path': str(rotated)}) + "\n"
+            + self.journal_line(rotated, info.mtime_ns)
+            + self.journal_line(rotated, info.mtime_ns)[:20]
+        )
+        
+        handler = rotation.LogCompressionHandler(output_dir=str(out), min_size_kb=0)
+        try:
+            assert not handler.should_process(info)
+        finally:
+            handler.stop()
+    
+    def test_compacted_above_line_limit(self, rotation, tmp_path, monkeypatch):
+        """Test a long journal is rewritten with the newest version per path"""
+        monkeypatch.setattr(rotation.LogCompressionHandler, "JOURNAL_COMPACT_LINES", 5)
+        out = tmp_path / "out"
+        out.mkdir()
+        journal = out / ".processed.jsonl"
+        journal.write_text(
+            "".join(self.journal_line(tmp_path / "a.log", n) for n in range(10))
+            + self.journal_line(tmp_path / "b.log", 7)
+        )
+        
+        handler = rotation.LogCompressionHandler(output_dir=str(out), min_size_kb=0)
+        handler.stop()
+        
+        entries = [json.loads(line) for line in journal.read_text().splitlines()]
+        assert sorted((Path(e['path']).name, e['mtime_ns']) for e in entries) == [("a.log", 9), ("b.log", 7)]
+    
+    def test_short_journal_is_left_alone(self, rotation, tmp_path):
+        """Test a journal under the limit is not rewritten on load"""
+        out = tmp_path / "out"
+        out.mkdir()
+        journal = out / ".processed.jsonl"
+        content = "".join(self.journal_line(tmp_path / "a.log", n) for n in range(3))
+        journal.write_text(content)
+        
+        handler = rotation.LogCompressionHandler(output_dir=str(out), min_size_kb=0)
+        handler.stop()
+        
+        assert journal.read_text() == content
+    
+    def test_filter_hit_is_confirmed_against_journal(self, rotation, tmp_path):
+        """Test a filter false positive does not skip an uncompressed file"""
+        logs, out = tmp_path / "logs", tmp_path / "out"
+        logs.mkdir()
+        rotated = logs / "app.log.1"
+        write_log(rotated, day=1, mtime=1_704_067_200)
+        info = rotation.FileInfo.from_path(str(rotated))
+        
+        handler = rotation.LogCompressionHandler(output_dir=str(out), min_size_kb=0)
+        try:
+            # Filter says "maybe", the journal has no such entry
+            handler.processed_files.add(handler._processed_key(str(rotated), info.mtime_ns))
+            assert handler.should_process(info)
+            
+            (out / ".processed.jsonl").write_text(self.journal_line(rotated, info.mtime_ns))
+            assert not handler.should_process(info)
+        finally:
+            handler.stop()
+    
+    def test_batch_pool_records_every_file(self, rotation, tmp_path):
+        """Test --once with several workers compresses and journals every file"""
+        logs, out = tmp_path / "logs", tmp_path / "out"
+        logs.mkdir()
+        for n in range(1, 4):
+            write_log(logs / f"app.log.{n}", day=n, mtime=1_704_067_200 + n * 86_400)
+        
+        rotation.compress_existing_files(str(logs), str(out), min_size_kb=0, jobs=2)
+        
+        assert len(list(out.glob("*.lsc"))) == 3
+        journal = [json.loads(line) for line in (out / ".processed.jsonl").read_text().splitlines()]
+        assert sorted(Path(e['path']).name for e in journal) == ["app.log.1", "app.log.2", "app.log.3"]
+        
+        # A second run finds nothing left to do
+        handler = rotation.LogCompressionHandler(output_dir=str(out), min_size_kb=0)
+        try:
+            assert not any(
+                handler.should_process(rotation.FileInfo.from_path(str(p))) for p in logs.iterdir()
+            )
+        finally:
+            handler.stop()
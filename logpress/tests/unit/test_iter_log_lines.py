@@ -0,0 +1,76 @@
+"""
+Unit tests for the mmap-based log line reader
+"""
+
+import pytest
+from logpress import api
+from logpress.api import _iter_log_lines
+
+class TestIterLogLines:
+    """Test _iter_log_lines matches text-mode line iteration"""
+    
+    @pytest.fixture
+    def write(self, tmp_path):
+        """Write raw bytes to a log file and return its path"""
+        def _write(data: bytes):
+            path = tmp_path / "test.log"
+            path.write_bytes(data)
+            return path
+        return _write
+    
+    def test_crlf_line_endings(self, write):
+        """Test CRLF lines are split and blank lines skipped"""
+        path = write(b"first\r\nsecond\r\n\r\nthird")
+        
+        assert list(_iter_log_lines(path)) == ["first", "second", "third"]
+    
+    def test_lone_carriage_return(self, write):
+        """Test a lone CR ends a line, as in text mode"""
+        path = write(b"progress 10%\rprogress 50%\rdone\n")
+        
+        assert list(_iter_log_lines(path)) == ["progress 10%", "progress 50%", "done"]
+    
+    def test_invalid_utf8_is_ignored(self, write):
+        """Test undecodable bytes are dropped instead of raising"""
+        path = write(b"ok \xff\xfeline\nnext\n")
+        
+        assert list(_iter_log_lines(path)) == ["ok line", "next"]
+    
+    def test_line_longer_than_block(self, write, monkeypatch):
+        """Test a line spanning several blocks is yielded whole"""
+        monkeypatch.setattr(api, "_READ_BLOCK_SIZE", 16)
+        long_line = "x" * 100
+        path = write(f"short\n{long_line}\r\nafter\rend".encode())
+        
+        assert list(_iter_log_lines(path)) == ["short", long_line, "after", "end"]
+    
+    def test_crlf_split_across_blocks(self, write, monkeypatch):
+        """Test a CRLF cut between two blocks yields no extra lines"""
+        monkeypatch.setattr(api, "_READ_BLOCK_SIZE", 8)
+        lines = [f"line{i:03d}" for i in range(50)]
+        path = write("\r\n".join(lines).encode())
+        
+        assert list(_iter_log_lines(path)) == lines
+    
+    def test_truncated_while_reading(self, write, monkeypatch):
+        """Test a file truncated mid-read (copytruncate) just ends early"""
+        monkeypatch.setattr(api, "_READ_BLOCK_SIZE", 16)
+        expected = [f"line{i:05d}" for i in range(10000)]
+        path = write("\n".join(expected).encode())
+        
+        lines = _iter_log_lines(path)
+        assert next(lines) == expected[0]
+        path.write_bytes(b"")
+        
+        # Whatever was already buffered is yielded (the last line possibly
+        # cut short), then the reader hits EOF
+        rest = list(lines)
+        assert len(rest) < len(expected) - 1
+        assert rest[:-1] == expected[1:len(rest)]
+        assert expected[len(rest)].startswith(rest[-1])
+    
+    def test_empty_file(self, write):
+        """Test an empty file yields nothing"""
+        path = write(b"")
+        
+        assert list(_iter_log_lines(path)) == []
@@ -0,0 +1,31 @@
+"""
+Unit tests for the lazily loaded package namespace
+"""
+
+import subprocess
+import sys
+import pytest
+import logpress
+
+class TestPackageExports:
+    """Test names exported by logpress resolve on first access"""
+    
+    @pytest.mark.parametrize("name", logpress.__all__)
+    def test_public_names_resolve(self, name):
+        """Test every name in __all__ can be accessed"""
+        assert getattr(logpress, name) is not None
+    
+    @pytest.mark.parametrize("name", ["api", "context", "models", "protocols", "services"])
+    def test_submodules_are_attributes(self, name):
+        """Test subpackages are reachable as attributes after a plain import"""
+        # Fresh interpreter: in this one the test setup already imported them
+        code = f"import logpress; print(logpress.{name}.__name__)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == f"logpress.{name}"
+    
+    def test_unknown_name_raises(self):
+        """Test missing attributes still raise AttributeError"""
+        with pytest.raises(AttributeError):
+            logpress.does_not_exist